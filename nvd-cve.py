@@ -1,19 +1,55 @@
 #!/usr/bin/env python3
 
 import argparse
+import concurrent.futures
 import datetime
-import gzip
+import email.utils
+import functools
+import itertools
 import json
 import sqlite3
 import textwrap
 import os
+import queue
+import re
+import urllib.error
 import urllib.request
+import zlib
 from tqdm import tqdm
 
+try:
+    # isal's igzip is a drop-in replacement for gzip that decompresses several times faster
+    from isal import igzip as gzip
+except ImportError:
+    import gzip
+
+try:
+    # orjson parses and serializes the NVD feeds several times faster than the json module
+    import orjson
+
+    json_loads = orjson.loads
+    json_dumpb = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumpb(obj):
+        return json.dumps(obj).encode()
+
 start_year   = 1999
 #current_year = 2004
 current_year = int(datetime.datetime.today().strftime('%Y'))
 
+# SQLITE_MAX_VARIABLE_NUMBER on SQLite builds older than 3.32.0
+max_variables = 999
+
+impact_weight = {'NONE': 0, 'LOW': 1, 'MEDIUM': 2, 'HIGH': 3, 'CRITICAL': 4}
+impact_names  = ['NONE', 'LOW', 'MEDIUM', 'HIGH', 'CRITICAL']
+type_marker   = re.compile(r'\*\* (REJECT|DISPUTED|RESERVED) \*\*')
+
+# type, severity and impact are stored in the database as integers: the type as its
+# type_id and severities/impact as their impact_weight (NULL if there is no severity)
+type_id = {'VALID': 0, 'REJECT': 1, 'DISPUTED': 2, 'RESERVED': 3}
+
 
 class DownloadProgressBar(tqdm):
     def update_to(self, b=1, bsize=1, tsize=None):
@@ -22,66 +58,97 @@ class DownloadProgressBar(tqdm):
         self.update(b * bsize - self.n)
 
 
+def cve_description(descriptions):
+    # join the descriptions of a CVE and work out its type from the NVD markers
+    description = 'No description info'
+    if len(descriptions) > 0:
+        description = '|'.join(descriptions)
+
+    # a single scan for any of the markers rather than one pass per marker
+    cve_type = 'VALID'
+    marker = type_marker.search(description)
+    if marker:
+        cve_type = marker.group(1)
+
+    return description, cve_type
+
+
+def cve_metrics(cve_entry):
+    # return the CVSSv2 and CVSSv3 score, metrics and severity of a CVE and the highest impact of either
+    cvss2_score    = 0
+    cvss2_metrics  = ''
+    cvss2_severity = ''
+    cvss3_score    = 0
+    cvss3_metrics  = ''
+    cvss3_severity = ''
+
+    impact_highest = 0
+    metrics = cve_entry.get('impact', {})
+
+    v2 = metrics.get('baseMetricV2')
+    if v2:
+        cvss2_score    = float(v2['cvssV2']['baseScore'])
+        cvss2_metrics  = v2['cvssV2']['vectorString']
+        cvss2_severity = v2['severity']
+        impact_highest = max(impact_highest, impact_weight.get(cvss2_severity, 0))
+
+    v3 = metrics.get('baseMetricV3')
+    if v3:
+        cvss3_score    = float(v3['cvssV3']['baseScore'])
+        cvss3_metrics  = v3['cvssV3']['vectorString']
+        cvss3_severity = v3['cvssV3']['baseSeverity']
+        impact_highest = max(impact_highest, impact_weight.get(cvss3_severity, 0))
+
+    impact = impact_names[impact_highest]
+
+    return cvss2_score, cvss2_metrics, cvss2_severity, cvss3_score, cvss3_metrics, cvss3_severity, impact
+
+
+def extract_row(cve_entry):
+    # build the database row for a CVE straight from the feed entry; this skips the
+    # date parsing and dict copy a full CVE object does, which import never uses
+    description, cve_type = cve_description([d['value'] for d in cve_entry['cve']['description']['description_data']])
+    _, _, cvss2_severity, _, _, cvss3_severity, impact = cve_metrics(cve_entry)
+
+    return (cve_entry['cve']['CVE_data_meta']['ID'],
+            cve_entry['lastModifiedDate'],
+            cve_entry['publishedDate'],
+            type_id[cve_type],
+            impact_weight.get(cvss3_severity),
+            impact_weight.get(cvss2_severity),
+            impact_weight[impact],
+            description,
+            zlib.compress(json_dumpb(cve_entry)))
+
+
 class CVE:
     def __init__(self, cve_entry):
-        self.cve_dict = {}
-        for key, value in cve_entry.items():
-            self.cve_dict[key] = value
+        self.cve_dict = cve_entry
 
         self.cve = cve_entry['cve']['CVE_data_meta']['ID']
         self.publishedDate = self.cve_dict['publishedDate']
-        self.publishedDateTime = datetime.datetime.strptime(self.cve_dict['publishedDate'], '%Y-%m-%dT%H:%MZ')
         self.lastModifiedDate = self.cve_dict['lastModifiedDate']
-        self.lastModifiedDateTime = datetime.datetime.strptime(self.cve_dict['lastModifiedDate'], '%Y-%m-%dT%H:%MZ')
 
         descriptions = []
         for d in cve_entry['cve']['description']['description_data']:
             descriptions.append(d['value'])
         self.cve_dict['descriptions'] = descriptions
 
-        self.description = 'No description info'
-        if len(descriptions) > 0:
-            self.description = '|'.join(descriptions)
-
-        self.type = 'VALID'
-        if '** REJECT **' in self.description:
-            self.type = 'REJECT'
-        if '** DISPUTED **' in self.description:
-            self.type = 'DISPUTED'
-        if '** RESERVED **' in self.description:
-            self.type = 'RESERVED'
-
-        self.cvss2_score    = 0
-        self.cvss2_metrics  = ''
-        self.cvss2_severity = ''
-        self.cvss3_score    = 0
-        self.cvss3_metrics  = ''
-        self.cvss3_severity = ''
-        self.scoring        = 0
-        self.impact         = 'NONE'
-
-        impact_weight  = {'LOW': 1, 'MEDIUM': 2, 'HIGH': 3, 'CRITICAL': 4}
-        impact_highest = 0
-        for key in ['baseMetricV2', 'baseMetricV3']:
-            try:
-                if key == 'baseMetricV2':
-                    self.cvss2_score    = float(self.cve_dict['impact'][key]['cvssV2']['baseScore'])
-                    self.cvss2_metrics  = self.cve_dict['impact'][key]['cvssV2']['vectorString']
-                    self.cvss2_severity = self.cve_dict['impact'][key]['severity']
-                    if impact_weight[self.cvss2_severity] > impact_highest:
-                        impact_highest = impact_weight[self.cvss2_severity]
-                elif key == 'baseMetricV3':
-                    self.cvss3_score    = float(self.cve_dict['impact'][key]['cvssV3']['baseScore'])
-                    self.cvss3_metrics  = self.cve_dict['impact'][key]['cvssV3']['vectorString']
-                    self.cvss3_severity = self.cve_dict['impact'][key]['cvssV3']['baseSeverity']
-                    if impact_weight[self.cvss3_severity] > impact_highest:
-                        impact_highest = impact_weight[self.cvss3_severity]
-            except:
-                pass
-
-        for k, v in impact_weight.items():
-            if impact_weight[k] == impact_highest:
-                self.impact = k
+        self.description, self.type = cve_description(descriptions)
+
+        self.scoring = 0
+        (self.cvss2_score, self.cvss2_metrics, self.cvss2_severity,
+         self.cvss3_score, self.cvss3_metrics, self.cvss3_severity,
+         self.impact) = cve_metrics(self.cve_dict)
+
+    # strptime is slow and the parsed dates are rarely needed, so only parse them on first use
+    @functools.cached_property
+    def publishedDateTime(self):
+        return datetime.datetime.strptime(self.publishedDate, '%Y-%m-%dT%H:%MZ')
+
+    @functools.cached_property
+    def lastModifiedDateTime(self):
+        return datetime.datetime.strptime(self.lastModifiedDate, '%Y-%m-%dT%H:%MZ')
 
     def __str__(self):
         return '{}: {}, {}'.format(self.cve,
@@ -89,24 +156,68 @@ class CVE:
                                    self.description[:30])
 
 
-def download(url, localfile):
-    # download an individual file
+def download(url, localfile, position=None):
+    # download an individual file; if we already have a copy only ask for it if it has changed
     if '/' not in url:
         print('No URL provided!')
         return None
 
+    request = urllib.request.Request(url)
+    if os.path.isfile(localfile):
+        request.add_header('If-Modified-Since', email.utils.formatdate(os.path.getmtime(localfile), usegmt=True))
+
     print(f'Downloading {url}...')
+    partfile = f'{localfile}.part'
     try:
-        with DownloadProgressBar(unit='B', unit_scale=True, miniters=1, desc=url.split('/')[-1]) as t:
-            urllib.request.urlretrieve(url, filename=localfile, reporthook=t.update_to)
+        with urllib.request.urlopen(request) as response, \
+                open(partfile, 'wb') as f, \
+                DownloadProgressBar(unit='B', unit_scale=True, miniters=1, desc=url.split('/')[-1],
+                                    position=position, leave=False) as t:
+            tsize = response.headers.get('Content-Length')
+            size  = 0
+            while block := response.read(1024 * 64):
+                f.write(block)
+                size += len(block)
+                t.update_to(bsize=size, tsize=int(tsize) if tsize else None)
+        # only replace our copy once the download is complete
+        os.replace(partfile, localfile)
         return localfile
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            # unchanged since we last downloaded it; mark our copy as fresh
+            print(f'{localfile} has not changed')
+            os.utime(localfile)
+            return localfile
+        print(f'Failed to download {url}')
+        print(e)
     except Exception as e:
         print(f'Failed to download {url}')
         print(e)
+    finally:
+        # don't leave a partial download behind if the transfer failed
+        if os.path.isfile(partfile):
+            os.remove(partfile)
 
     return None
 
 
+def refresh_gzip(url, gzfile, positions):
+    # download an NVD gzip file unless we've already downloaded it today
+    if os.path.isfile(gzfile):
+        dt_now = datetime.datetime.now()
+        dt_cre = datetime.datetime.fromtimestamp(os.path.getctime(gzfile))
+        if (dt_now - dt_cre).total_seconds() <= 60*60*24:
+            return None
+        print(f'{gzfile} is older than 24h, refreshing...')
+
+    # take a free progress bar line so concurrent downloads don't draw over each other
+    position = positions.get()
+    try:
+        return download(url, gzfile, position)
+    finally:
+        positions.put(position)
+
+
 def download_gzips():
     # download the NVD gzip files
     hosturl = 'https://nvd.nist.gov/feeds/json/cve/1.1/'
@@ -118,38 +229,45 @@ def download_gzips():
         i = i + 1
         years.append(f'{fname}{i}.json.gz')
 
-    downloaded = []
-
-    for gzfile in years:
-        if os.path.isfile(gzfile):
-            # don't download if we've already downloaded today
-            dt_now = datetime.datetime.now()
-            dt_cre = datetime.datetime.fromtimestamp(os.path.getctime(gzfile))
-            if (dt_now - dt_cre).total_seconds() > 60*60*24:
-                print(f'{gzfile} is older than 24h, refreshing...')
-                dl_file = download(f'{hosturl}{gzfile}', gzfile)
-                if dl_file is not None:
-                    downloaded.append(gzfile)
-        else:
-            dl_file = download(f'{hosturl}{gzfile}', gzfile)
-            if dl_file is not None:
-                downloaded.append(gzfile)
+    # the downloads are independent and mostly waiting on the network, so fetch several at once
+    workers   = 8
+    positions = queue.SimpleQueue()
+    for x in range(workers):
+        positions.put(x)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(refresh_gzip, [f'{hosturl}{x}' for x in years], years, itertools.repeat(positions)))
 
     return years
 
 
 def parse_nvd(gzfile):
-    # gunzip and return JSON
+    # gunzip and return a database row for each CVE in the JSON feed
     if not os.path.isfile(gzfile):
         print(f'File {gzfile} does not exist!')
-        return None
+        return []
 
     with gzip.open(gzfile, 'rb') as f:
-        j = json.loads(f.read())
+        j = json_loads(f.read())
 
-        cve_entries = [CVE(cve_dict) for cve_dict in j['CVE_Items']]
+    return [extract_row(cve_dict) for cve_dict in j['CVE_Items']]
 
-    return cve_entries
+
+def cve_rows(gzips):
+    # the feeds are independent so gunzip and parse them in parallel; rows are yielded
+    # in feed order as each one completes so inserting overlaps with parsing the rest
+    with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for rows in executor.map(parse_nvd, gzips):
+            yield from rows
+
+
+def year_constraint(year):
+    # WHERE clause limiting publishedDate to a single year; compares against the
+    # ISO date prefix rather than using LIKE '%YYYY%' so an index can be used
+    if not year:
+        return '', []
+
+    return 'WHERE publishedDate >= ? AND publishedDate < ?', [str(year), str(year + 1)]
 
 
 def main():
@@ -160,49 +278,43 @@ def main():
                         help='Display CVE count by year')
     parser.add_argument('--severity-stats', dest='severity_stats', metavar='Vx', default=None,
                         help='Display CVE severity counts by year using either CVSS V2, V3, V4 or ALL to print the highest of any')
-    parser.add_argument('--year', dest='const_year', metavar='YEAR', default=None, help='Constrain results to YEAR')
+    parser.add_argument('--year', dest='const_year', metavar='YEAR', type=int, default=None, help='Constrain results to YEAR')
     parser.add_argument('--cve', dest='cve', action='append', help='Display CVE; can use multiple times')
 
     args = parser.parse_args()
 
     conn = sqlite3.connect('nvdcves.db')
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA cache_size=-262144')   # 256MB
     c    = conn.cursor()
 
     if args.importcve:
         print('Loading and downloading NVD entries ')
         gzips = download_gzips()
-        cves  = []
-
-        for x in gzips:
-            # load local and downloaded files
-            cves.extend(parse_nvd(x))
-
-        data       = []
-        line_count = 0
-        for row in cves:
-            if line_count == 0:
-                try:
-                    c.execute('DROP TABLE cves')
-                except:
-                    print('Initializing database')
-                c.execute('CREATE TABLE cves (Num int, Id text, lastModifiedDate text, publishedDate text, type text, severity3 text, severity2 text, impact text, description text, cve_dict text)')
-                line_count += 1
-            else:
-                # tuple to add to database
-                data.append((line_count,
-                             row.cve,
-                             row.lastModifiedDate,
-                             row.publishedDate,
-                             row.type,
-                             row.cvss3_severity,
-                             row.cvss2_severity,
-                             row.impact,
-                             json.dumps(row.description),
-                             json.dumps(row.cve_dict)))
-                line_count += 1
-
-        c.executemany('INSERT INTO cves VALUES (?,?,?,?,?,?,?,?,?,?)', data)
-        print(f'Imported {line_count-1} rows')
+
+        # rebuild the table in a single transaction so the bulk insert is committed only once
+        conn.execute('BEGIN')
+        try:
+            c.execute('DROP TABLE cves')
+        except:
+            print('Initializing database')
+        c.execute('CREATE TABLE cves (Id text, lastModifiedDate text, publishedDate text, type integer, severity3 integer, severity2 integer, impact integer, description text, cve_dict blob)')
+
+        # rows are streamed from the feeds straight into the database
+        c.executemany('INSERT INTO cves VALUES (?,?,?,?,?,?,?,?,?)', cve_rows(gzips))
+        line_count = c.rowcount
+
+        # build indexes after the bulk insert so we don't pay to maintain them on every row;
+        # dropping the table above drops any indexes from a previous import as well
+        print('Creating indexes')
+        c.execute('CREATE UNIQUE INDEX idx_id ON cves(Id)')
+        c.execute('CREATE INDEX idx_pub_type ON cves(publishedDate, type)')
+        c.execute('CREATE INDEX idx_pub_sev2 ON cves(publishedDate, severity2)')
+        c.execute('CREATE INDEX idx_pub_sev3 ON cves(publishedDate, severity3)')
+        c.execute('CREATE INDEX idx_pub_impact ON cves(publishedDate, impact)')
+        print(f'Imported {line_count} rows')
         conn.commit()
         conn.close()
         exit(0)
@@ -214,21 +326,17 @@ def main():
         else:
             years = list(range(start_year, current_year+1, 1))
 
+        # count every type for every year in a single pass rather than scanning the table per year;
+        # SUM() over a comparison counts the matching rows as SQLite evaluates it to 0 or 1
+        where, params = year_constraint(args.const_year)
+        counts = {}
+        for row in c.execute(f'SELECT substr(publishedDate, 1, 4), SUM(type = ?), SUM(type = ?), SUM(type = ?), SUM(type = ?) FROM cves {where} GROUP BY 1',
+                             [type_id[x] for x in ['VALID', 'REJECT', 'DISPUTED', 'RESERVED']] + params):
+            counts[row[0]] = row[1:]
+
         last_year = 0
         for y in years:
-            cve_valid    = 0
-            cve_rejected = 0
-            cve_disputed = 0
-            cve_reserved = 0
-
-            for row in c.execute('SELECT COUNT(Num) FROM cves WHERE publishedDate LIKE ? AND type = ?', [f'%{y}%', 'VALID']):
-                cve_valid = row[0]
-            for row in c.execute('SELECT COUNT(Num) FROM cves WHERE publishedDate LIKE ? AND type = ?', [f'%{y}%', 'REJECT']):
-                cve_rejected = row[0]
-            for row in c.execute('SELECT COUNT(Num) FROM cves WHERE publishedDate LIKE ? AND type = ?', [f'%{y}%', 'DISPUTED']):
-                cve_disputed = row[0]
-            for row in c.execute('SELECT COUNT(Num) FROM cves WHERE publishedDate LIKE ? AND type = ?', [f'%{y}%', 'RESERVED']):
-                cve_reserved = row[0]
+            cve_valid, cve_rejected, cve_disputed, cve_reserved = counts.get(str(y), (0, 0, 0, 0))
             cve_all = cve_valid + cve_rejected + cve_disputed + cve_reserved
 
             if last_year > 0:
@@ -252,77 +360,64 @@ def main():
         else:
             years = list(range(start_year, current_year+1, 1))
 
+        column = {'V2': 'severity2', 'V3': 'severity3', 'ALL': 'impact'}[args.severity_stats]
+        where, params = year_constraint(args.const_year)
+        if where:
+            where += ' AND type = ?'
+        else:
+            where = 'WHERE type = ?'
+        params.append(type_id['VALID'])
+
+        # severities are NULL when a CVE has no score for that CVSS version; IS rather than =
+        # keeps those rows counting as 0 instead of turning a year's whole SUM() into NULL
+        counts = {}
+        for row in c.execute(f'SELECT substr(publishedDate, 1, 4), SUM({column} IS ?), SUM({column} IS ?), SUM({column} IS ?), SUM({column} IS ?), SUM({column} IS ?) FROM cves {where} GROUP BY 1',
+                             [impact_weight[x] for x in ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW', 'NONE']] + params):
+            counts[row[0]] = row[1:]
+
         for y in years:
-            cve_critical = 0
-            cve_high     = 0
-            cve_medium   = 0
-            cve_low      = 0
-            cve_none     = 0
-            if args.severity_stats == 'V2':
-                for row in c.execute('SELECT COUNT(Num) FROM cves WHERE publishedDate LIKE ? AND type = ? AND severity2 = ?', [f'%{y}%', 'VALID', 'CRITICAL']):
-                    cve_critical = row[0]
-                for row in c.execute('SELECT COUNT(Num) FROM cves WHERE publishedDate LIKE ? AND type = ? AND severity2 = ?', [f'%{y}%', 'VALID', 'HIGH']):
-                    cve_high = row[0]
-                for row in c.execute('SELECT COUNT(Num) FROM cves WHERE publishedDate LIKE ? AND type = ? AND severity2 = ?', [f'%{y}%', 'VALID', 'MEDIUM']):
-                    cve_medium = row[0]
-                for row in c.execute('SELECT COUNT(Num) FROM cves WHERE publishedDate LIKE ? AND type = ? AND severity2 = ?', [f'%{y}%', 'VALID', 'LOW']):
-                    cve_low = row[0]
-                for row in c.execute('SELECT COUNT(Num) FROM cves WHERE publishedDate LIKE ? AND type = ? AND severity2 = ?', [f'%{y}%', 'VALID', 'NONE']):
-                    cve_none = row[0]
-            elif args.severity_stats == 'V3':
-                for row in c.execute('SELECT COUNT(Num) FROM cves WHERE publishedDate LIKE ? AND type = ? AND severity3 = ?', [f'%{y}%', 'VALID', 'CRITICAL']):
-                    cve_critical = row[0]
-                for row in c.execute('SELECT COUNT(Num) FROM cves WHERE publishedDate LIKE ? AND type = ? AND severity3 = ?', [f'%{y}%', 'VALID', 'HIGH']):
-                    cve_high = row[0]
-                for row in c.execute('SELECT COUNT(Num) FROM cves WHERE publishedDate LIKE ? AND type = ? AND severity3 = ?', [f'%{y}%', 'VALID', 'MEDIUM']):
-                    cve_medium = row[0]
-                for row in c.execute('SELECT COUNT(Num) FROM cves WHERE publishedDate LIKE ? AND type = ? AND severity3 = ?', [f'%{y}%', 'VALID', 'LOW']):
-                    cve_low = row[0]
-                for row in c.execute('SELECT COUNT(Num) FROM cves WHERE publishedDate LIKE ? AND type = ? AND severity3 = ?', [f'%{y}%', 'VALID', 'NONE']):
-                    cve_none = row[0]
-            elif args.severity_stats == 'ALL':
-                for row in c.execute('SELECT COUNT(Num) FROM cves WHERE publishedDate LIKE ? AND type = ? AND impact = ?', [f'%{y}%', 'VALID', 'CRITICAL']):
-                    cve_critical = row[0]
-                for row in c.execute('SELECT COUNT(Num) FROM cves WHERE publishedDate LIKE ? AND type = ? AND impact = ?', [f'%{y}%', 'VALID', 'HIGH']):
-                    cve_high = row[0]
-                for row in c.execute('SELECT COUNT(Num) FROM cves WHERE publishedDate LIKE ? AND type = ? AND impact = ?', [f'%{y}%', 'VALID', 'MEDIUM']):
-                    cve_medium = row[0]
-                for row in c.execute('SELECT COUNT(Num) FROM cves WHERE publishedDate LIKE ? AND type = ? AND impact = ?', [f'%{y}%', 'VALID', 'LOW']):
-                    cve_low = row[0]
-                for row in c.execute('SELECT COUNT(Num) FROM cves WHERE publishedDate LIKE ? AND type = ? AND impact = ?', [f'%{y}%', 'VALID', 'NONE']):
-                    cve_none = row[0]
-            else:
-                return
+            cve_critical, cve_high, cve_medium, cve_low, cve_none = counts.get(str(y), (0, 0, 0, 0, 0))
 
             cve_total = cve_critical + cve_high + cve_medium + cve_low + cve_none
             print(f'{y}: CRITICAL={cve_critical},HIGH={cve_high},MEDIUM={cve_medium},LOW={cve_low},NONE={cve_none}  TOTAL={cve_total}')
 
     if args.cve:
+        # fetch all of the requested CVEs with one IN query rather than a query per CVE,
+        # chunked to stay under SQLite's limit on bound parameters
+        found = {}
+        ids   = list(dict.fromkeys(args.cve))
+        for i in range(0, len(ids), max_variables):
+            chunk = ids[i:i + max_variables]
+            for row in c.execute(f'SELECT Id, cve_dict FROM cves WHERE Id IN ({",".join("?" * len(chunk))})', chunk):
+                found[row[0]] = row[1]
+
         for x in args.cve:
-            for row in c.execute('SELECT cve_dict FROM cves WHERE Id = ?', [x]):
-                type = ''
-
-                cve = CVE(json.loads(row[0]))
-                #print(vars(cve))
-
-                if cve.type != 'VALID':
-                    type = f'** {cve.type} **'
-
-                if cve.cvss3_severity:
-                    print(f'{cve.cve} - {type} {cve.cvss3_severity}, {cve.cvss3_score} ({cve.cvss3_metrics})')
-                elif cve.cvss2_severity:
-                    print(f'{cve.cve} - {type} {cve.cvss2_severity}, {cve.cvss2_score} (CVSS:2.0/{cve.cvss2_metrics})')
-                else:
-                    print(f'{cve.cve} {type}')
-
-                print(f'Published   : {cve.publishedDate}')
-                if cve.publishedDate != cve.lastModifiedDate:
-                    print(f'Last updated: {cve.lastModifiedDate}')
-
-                width_size = os.get_terminal_size()
-                for line in textwrap.wrap(cve.description, width=(width_size.columns - 20), initial_indent='    ', subsequent_indent='    '):
-                    print(line)
-                print()
+            if x not in found:
+                continue
+
+            type = ''
+
+            cve = CVE(json_loads(zlib.decompress(found[x])))
+            #print(vars(cve))
+
+            if cve.type != 'VALID':
+                type = f'** {cve.type} **'
+
+            if cve.cvss3_severity:
+                print(f'{cve.cve} - {type} {cve.cvss3_severity}, {cve.cvss3_score} ({cve.cvss3_metrics})')
+            elif cve.cvss2_severity:
+                print(f'{cve.cve} - {type} {cve.cvss2_severity}, {cve.cvss2_score} (CVSS:2.0/{cve.cvss2_metrics})')
+            else:
+                print(f'{cve.cve} {type}')
+
+            print(f'Published   : {cve.publishedDate}')
+            if cve.publishedDate != cve.lastModifiedDate:
+                print(f'Last updated: {cve.lastModifiedDate}')
+
+            width_size = os.get_terminal_size()
+            for line in textwrap.wrap(cve.description, width=(width_size.columns - 20), initial_indent='    ', subsequent_indent='    '):
+                print(line)
+            print()
 
 
 if __name__ == '__main__':